@@ -1,55 +1,90 @@
 import logging
 import json
-import csv
-from io import StringIO
-from datetime import datetime
+import operator
 from abc import ABC, abstractmethod
 
+try:
+    from orjson import dumps as _json_dumps      # Rust, returns bytes
+
+    # orjson serializes dataclasses and datetimes natively, so an event
+    # can be dumped without materializing the to_dict() intermediate.
+    _event_dumps = _json_dumps
+except ImportError:                              # orjson optional
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+    def _event_dumps(event):
+        return _json_dumps(event.to_dict())
+
+# Characters that force a CSV field to be quoted.
+_CSV_SPECIAL = frozenset(',"\n\r')
+
+def _needs_quote(s: str) -> bool:
+    return not _CSV_SPECIAL.isdisjoint(s)
+
+def _csv_escape(s: str) -> str:
+    """Quote a CSV field only when it actually needs it."""
+    if _needs_quote(s):
+        return '"' + s.replace('"', '""') + '"'
+    return s
+
 class BaseFormatter(ABC):
     @abstractmethod
     def format(self, log_event):
-        pass
+        """Return the event as newline-terminated UTF-8 bytes, ready for
+        the wire, or None on error."""
 
 class CEFFormatter(BaseFormatter):
+    SEVERITY_MAP = {
+        "critical": "10",
+        "error": "8",
+        "warning": "6",
+        "info": "4",
+        "debug": "2"
+    }
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.cef_version = "0"
         self.device_vendor = "LogForwarder"
         self.device_product = "LogForwarder"
         self.device_version = "1.0"
-
-    def format(self, log_event):
-        try:
-            severity_map = {
-                "critical": "10",
-                "error": "8",
-                "warning": "6",
-                "info": "4",
-                "debug": "2"
-            }
-            severity = severity_map.get(log_event.severity.lower(), "4")
-
-            extension = {
-                "msg": log_event.message,
-                "cat": log_event.category,
-                "src": log_event.ip_address,
-                "duser": log_event.user,
-                "eventId": log_event.event_id,
-                "rt": log_event.timestamp.isoformat() if isinstance(log_event.timestamp, datetime) else log_event.timestamp
-            }
-
-            if log_event.raw_data:
-                for key, value in log_event.raw_data.items():
-                    extension[f"raw_{key}"] = str(value)
-
-            extension_str = " ".join([f"{k}={v}" for k, v in extension.items()])
+        self._prefix = (
+            f"CEF:{self.cef_version}|{self.device_vendor}|"
+            f"{self.device_product}|{self.device_version}|"
+        )
+        self._fast_format = self._specialize()
+
+    def _specialize(self):
+        """Build the per-event format closure with everything it touches
+        bound to locals, so the hot path resolves no self attributes or
+        globals. The device identity is fixed at construction time, which
+        is what makes this specialization safe."""
+        prefix = self._prefix
+        sev_get = self.SEVERITY_MAP.get
+
+        def fmt(e):
+            severity = sev_get(e.severity.lower(), "4")
+
+            extension_str = (
+                f"msg={e.message} cat={e.category} "
+                f"src={e.ip_address} duser={e.user} "
+                f"eventId={e.event_id} rt={e._iso}"
+            )
+            if e.raw_data:
+                extension_str += "".join(
+                    f" raw_{key}={value}" for key, value in e.raw_data.items()
+                )
 
             return (
-                f"CEF:{self.cef_version}|{self.device_vendor}|{self.device_product}|"
-                f"{self.device_version}|{log_event.category}|{log_event.message}|"
-                f"{severity}|{extension_str}"
-            )
+                f"{prefix}{e.category}|{e.message}|{severity}|{extension_str}\n"
+            ).encode('utf-8', 'replace')
 
+        return fmt
+
+    def format(self, log_event):
+        try:
+            return self._fast_format(log_event)
         except Exception as e:
             self.logger.error(f"Error formatting log to CEF: {str(e)}")
             return None
@@ -58,27 +93,26 @@ class CSVFormatter(BaseFormatter):
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.fieldnames = [
-            'timestamp', 'category', 'severity', 'message', 
+            'timestamp', 'category', 'severity', 'message',
             'event_id', 'user', 'ip_address', 'raw_data'
         ]
+        # raw_data is emitted as an empty trailing column, so only the
+        # first seven fields are read off the event; the timestamp column
+        # reads the precomputed ISO string.
+        self._getter = operator.attrgetter('_iso', *self.fieldnames[1:-1])
 
     def format(self, log_event):
         try:
-            raw_data_str = json.dumps(log_event.raw_data) if log_event.raw_data else ""
-
-            output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=self.fieldnames, quoting=csv.QUOTE_MINIMAL)
-            row = {
-                'timestamp': log_event.timestamp.isoformat() if isinstance(log_event.timestamp, datetime) else log_event.timestamp,
-                'category': log_event.category,
-                'severity': log_event.severity,
-                'message': log_event.message,
-                'event_id': log_event.event_id,
-                'user': log_event.user,
-                'ip_address': log_event.ip_address,
-            }
-            writer.writerow(row)
-            return output.getvalue().strip()
+            fields = []
+            append = fields.append
+            for value in self._getter(log_event):
+                if value is None:
+                    value = ''
+                elif value.__class__ is not str:
+                    value = str(value)
+                append(_csv_escape(value))
+            append('')  # raw_data placeholder column
+            return (",".join(fields) + "\n").encode('utf-8', 'replace')
 
         except Exception as e:
             self.logger.error(f"Error formatting log to CSV: {str(e)}")
@@ -90,7 +124,9 @@ class JSONFormatter(BaseFormatter):
 
     def format(self, log_event):
         try:
-            return json.dumps(log_event.to_dict())
+            # With orjson installed this serializes the dataclass directly
+            # and skips both the to_dict() dict build and the UTF-8 encode.
+            return _event_dumps(log_event) + b"\n"
         except Exception as e:
             self.logger.error(f"Error formatting log to JSON: {str(e)}")
             return None
@@ -1,11 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class LogEvent:
-    """Standardized log event structure."""
-    
+    """Standardized log event structure.
+
+    The timestamp is normalized to a datetime at construction, so
+    downstream formatters never need a type check; the ISO string is
+    computed once and cached in _iso (underscore-prefixed fields are
+    skipped by orjson's dataclass serializer, so it stays off the wire).
+    """
+
     timestamp: datetime
     source: str
     category: str
@@ -15,11 +21,17 @@ class LogEvent:
     event_id: Optional[str] = None
     user: Optional[str] = None
     ip_address: Optional[str] = None
-    
+    _iso: str = field(init=False, repr=False, compare=False, default='')
+
+    def __post_init__(self):
+        if not isinstance(self.timestamp, datetime):
+            self.timestamp = datetime.fromisoformat(self.timestamp)
+        self._iso = self.timestamp.isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert the log event to a dictionary."""
         return {
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self._iso,
             'source': self.source,
             'category': self.category,
             'severity': self.severity,
@@ -1,7 +1,22 @@
+import os
+import queue
 import socket, logging, json, time, threading
 from typing import List, Any, Dict
 from datetime import datetime
 
+# sendmsg rejects more than IOV_MAX iovecs per call (EMSGSIZE), so big
+# drained batches are written in windows of at most this many chunks.
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (OSError, ValueError):
+    _IOV_MAX = 1024
+
+try:
+    from orjson import dumps as _json_dumps      # Rust, returns bytes
+except ImportError:                              # orjson optional
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 
 try:
     from web.app import add_log
@@ -9,9 +24,32 @@ except ImportError:      # web UI optional
     def add_log(*_, **__):
         pass
 
+# When the web UI is absent, add_log is the no-op stub above; skip all
+# per-event timestamp/dict work in that case.
+_ADD_LOG_ACTIVE = add_log.__module__ != __name__
+
+# The whole-second timestamp string rarely changes between consecutive
+# events, so cache the last one keyed by int(time.time()). List mutation
+# is GIL-atomic, so no extra lock is needed.
+_TS_CACHE = [0, ""]
+
+def _now_iso() -> str:
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[:] = [now, datetime.utcfromtimestamp(now).isoformat(timespec='seconds')]
+    return _TS_CACHE[1]
+
 logger = logging.getLogger(__name__)
 
 class TCPSender:
+    """Queued TCP log sender.
+
+    Producers enqueue entries without taking any lock; a single daemon
+    writer thread drains the queue, coalesces entries and owns the socket.
+    Delivery is therefore asynchronous: send_log/send_logs return True
+    once the entry is accepted for delivery.
+    """
+
     def __init__(self, cfg: Dict[str, Any]):
         self.host = cfg['host']
         self.port = cfg['port']
@@ -21,6 +59,20 @@ class TCPSender:
         self._lock = threading.Lock()
         self._last_connect = 0.0
 
+        # Userspace write coalescing: appends go to _buf, which is flushed
+        # once it reaches _buf_max bytes or when the writer thread has been
+        # idle for _flush_interval seconds. Set send_buffer to 0 to write
+        # each drained batch through immediately.
+        self._buf = bytearray()
+        self._buf_max = cfg.get('send_buffer', 65536)
+        self._flush_interval = cfg.get('flush_interval', 0.2)
+
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, daemon=True, name='tcp-sender-writer'
+        )
+        self._writer.start()
+
     # ------------------------------------------------------------------ #
     def connect(self) -> bool:
         now = time.time()
@@ -32,6 +84,21 @@ class TCPSender:
             s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.settimeout(self.timeout)
             s.connect((self.host, self.port))
+            # With the userspace coalescer on, writes are already batched,
+            # so leave Nagle enabled; without it, disable Nagle so each
+            # line goes out immediately.
+            if self._buf_max <= 0:
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+            # Let the kernel detect dead peers instead of waiting for the
+            # next send to fail (Linux-only knobs guarded by hasattr).
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            if hasattr(socket, 'TCP_USER_TIMEOUT'):
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, 60000)
             self.socket = s
             logger.info(f'Connected to {self.host}:{self.port}')
             return True
@@ -41,44 +108,160 @@ class TCPSender:
             return False
 
     # ------------------------------------------------------------------ #
-    def disconnect(self):
-        if self.socket:
+    def _writer_loop(self):
+        """Single consumer: drain the queue, coalesce, write."""
+        while True:
             try:
-                self.socket.close()
+                entry = self._q.get(timeout=self._flush_interval)
+            except queue.Empty:
+                if self._buf:
+                    self.flush()
+                continue
+
+            entries = [entry]
+            while True:
+                try:
+                    entries.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(entries)
             except Exception as exc:
-                logger.debug(f'Disconnect error: {exc}')
-        self.socket = None
+                # A poison entry (e.g. an unserializable dict) must not
+                # kill the only writer thread: log, drop the batch, and
+                # keep draining.
+                logger.error(f'Writer failed on batch of {len(entries)}: {exc}')
+
+    def _write_batch(self, entries: List[Any]):
+        chunks = [self._encode(e) for e in entries]
+
+        with self._lock:
+            if self._buf_max > 0:
+                for chunk in chunks:
+                    self._buf += chunk
+                ok = True
+                if len(self._buf) >= self._buf_max:
+                    ok = self._flush_locked()
+            else:
+                ok = self._sendmsg(chunks)
+
+        if not ok or not _ADD_LOG_ACTIVE:
+            return
+        for entry, chunk in zip(entries, chunks):
+            add_log({
+                'timestamp': _now_iso(),
+                # chunks always end with the newline _encode appended, so a
+                # slice is enough -- no strip() allocation.
+                'data': chunk[:-1].decode('utf-8', 'replace'),
+                'raw': entry,
+            })
+
+    # ------------------------------------------------------------------ #
+    def flush(self) -> bool:
+        """Flush any buffered bytes to the socket."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> bool:
+        if not self._buf:
+            return True
+        if not self.socket and not self.connect():
+            return False
+
+        try:
+            self.socket.sendall(bytes(self._buf))
+            self._buf.clear()
+            return True
+        except (BrokenPipeError, OSError) as exc:
+            # Keep the buffer so the next flush can retry after reconnect.
+            logger.warning(f'Flush failed ({exc}); reconnecting...')
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
+            return False
+
+    # ------------------------------------------------------------------ #
+    def disconnect(self):
+        # Best-effort drain of anything still queued before closing.
+        pending = []
+        while True:
+            try:
+                pending.append(self._q.get_nowait())
+            except queue.Empty:
+                break
+        if pending:
+            self._write_batch(pending)
+
+        with self._lock:
+            if self._buf:
+                try:
+                    if self.socket:
+                        self.socket.sendall(bytes(self._buf))
+                except Exception as exc:
+                    logger.debug(f'Final flush error: {exc}')
+                self._buf.clear()
+            if self.socket:
+                try:
+                    self.socket.close()
+                except Exception as exc:
+                    logger.debug(f'Disconnect error: {exc}')
+            self.socket = None
         logger.info('Disconnected from TCP server')
 
     # ------------------------------------------------------------------ #
-    def _send(self, data: str):
+    def _sendmsg(self, chunks: List[bytes]) -> bool:
+        """Scatter-gather write: one sendmsg syscall per IOV_MAX-sized
+        window of chunks, no concatenation."""
         if not self.socket and not self.connect():
             return False
 
         try:
-            self.socket.sendall(data.encode('utf-8', 'replace'))
+            for start in range(0, len(chunks), _IOV_MAX):
+                window = chunks[start:start + _IOV_MAX]
+                sent = self.socket.sendmsg(window)
+                total = sum(len(c) for c in window)
+                if sent < total:             # rare partial write
+                    self.socket.sendall(b"".join(window)[sent:])
             return True
         except (BrokenPipeError, OSError) as exc:
             logger.warning(f'Send failed ({exc}); reconnecting...')
-            self.disconnect()
+            try:
+                self.socket.close()
+            except Exception:
+                pass
+            self.socket = None
             return False
 
     # ------------------------------------------------------------------ #
-    def send_log(self, entry: Any) -> bool:
-        log_str = json.dumps(entry) if isinstance(entry, dict) else str(entry)
+    @staticmethod
+    def _encode(entry: Any) -> bytes:
+        if isinstance(entry, bytes):
+            return entry if entry.endswith(b'\n') else entry + b'\n'
+        if isinstance(entry, dict):
+            return _json_dumps(entry) + b'\n'
+        log_str = str(entry)
         if not log_str.endswith('\n'):
             log_str += '\n'
+        return log_str.encode('utf-8', 'replace')
 
-        with self._lock:
-            ok = self._send(log_str)
-            if ok:
-                add_log({
-                    'timestamp': datetime.utcnow().isoformat(timespec='seconds'),
-                    'data': log_str.strip(),
-                    'raw': entry,
-                })
-            return ok
+    # ------------------------------------------------------------------ #
+    def send_log(self, entry: Any) -> bool:
+        """Queue one entry for delivery (lock-free on the producer side)."""
+        self._q.put_nowait(entry)
+        return True
 
     # ------------------------------------------------------------------ #
     def send_logs(self, entries: List[Any]) -> bool:
-        return all(self.send_log(e) for e in entries)
+        """Queue a batch of entries for delivery; the writer thread
+        coalesces everything queued into as few syscalls as possible."""
+        for entry in entries:
+            self._q.put_nowait(entry)
+        return True
+
+    # ------------------------------------------------------------------ #
+    async def send_logs_async(self, entries: List[Any]) -> bool:
+        """Async entry point; enqueueing never blocks the event loop."""
+        return self.send_logs(entries)
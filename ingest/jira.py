@@ -1,5 +1,7 @@
 import aiohttp
 import asyncio
+import os
+import random
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import logging
@@ -8,6 +10,11 @@ from pathlib import Path
 from .base import AbstractLogSource
 from core.log_event import LogEvent
 
+try:
+    from orjson import loads as _json_loads      # Rust, SIMD-accelerated
+except ImportError:                              # orjson optional
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +22,10 @@ JIRA_MAX_RESULTS = 1000          # Jira Cloud hard-limit per request
 MAX_RETRIES      = 5             # after that we give up
 BASE_BACKOFF     = 2.0           # seconds
 
+# Sidecar file holding just the last fetch timestamp, so a successful
+# fetch does not rewrite the whole config.json.
+LAST_FETCH_PATH  = Path('state/last_fetch.txt')
+
 class JiraIngest(AbstractLogSource):
     """Jira audit log ingestion source."""
     
@@ -24,12 +35,18 @@ class JiraIngest(AbstractLogSource):
         self.username = config['username']
         self.password = config['password']
         self.categories = config.get('categories', ['all'])
+        self.parallelism = config.get('parallelism', 4)
         self.session = None
         self.last_fetch_time = self._load_last_fetch_time()
     
     def _load_last_fetch_time(self) -> datetime | None:
-        """Load last fetch time from config file."""
+        """Load last fetch time from the state file (falling back to the
+        legacy location inside config.json)."""
         try:
+            if LAST_FETCH_PATH.exists():
+                return datetime.fromisoformat(LAST_FETCH_PATH.read_text().strip())
+
+            # Legacy: earlier versions stored the timestamp in config.json.
             config_path = Path('config/config.json')
             if config_path.exists():
                 with open(config_path) as f:
@@ -43,27 +60,14 @@ class JiraIngest(AbstractLogSource):
         return None
 
     def _save_last_fetch_time(self, fetch_time: datetime):
-        """Save last fetch time to config file."""
+        """Save last fetch time to the state file (atomic rename, so a
+        crash mid-write never leaves a torn timestamp)."""
         try:
-            config_path = Path('config/config.json')
-            if config_path.exists():
-                with open(config_path) as f:
-                    config = json.load(f)
-                
-                # Ensure the structure exists
-                if 'log_sources' not in config:
-                    config['log_sources'] = {}
-                if 'jira' not in config['log_sources']:
-                    config['log_sources']['jira'] = {}
-                
-                # Update the last fetch time
-                config['log_sources']['jira']['last_fetch_time'] = fetch_time.isoformat()
-                
-                # Save the updated config
-                with open(config_path, 'w') as f:
-                    json.dump(config, f, indent=2)
-                
-                logger.debug(f"Saved last fetch time: {fetch_time.isoformat()}")
+            LAST_FETCH_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = LAST_FETCH_PATH.with_suffix('.tmp')
+            tmp_path.write_text(fetch_time.isoformat())
+            os.replace(tmp_path, LAST_FETCH_PATH)
+            logger.debug(f"Saved last fetch time: {fetch_time.isoformat()}")
         except Exception as e:
             logger.error(f"Error saving last fetch time: {str(e)}")
 
@@ -104,7 +108,9 @@ class JiraIngest(AbstractLogSource):
         while retry <= MAX_RETRIES:
             async with self.session.get(url, **kwargs) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    # Decode the raw body with orjson rather than the
+                    # stdlib decoder resp.json() runs in the event loop.
+                    return _json_loads(await resp.read())
 
                 # 429 or custom headers ⇒ back-off
                 if resp.status == 429 or resp.headers.get("X-RateLimit-Remaining") == "0":
@@ -157,21 +163,43 @@ class JiraIngest(AbstractLogSource):
 
             logs: list[LogEvent] = []
 
-            while True:
-                data = await self._request_with_backoff(base_url, params=params)
-                if not data:                       # error already logged
-                    break
-
-                logs.extend(self._parse_logs(data))
-
-                # ---------------- pagination ---------------- #
-                next_page = data.get("nextPage")
-                if not next_page:
-                    break
-
-                # Jira returns full URL in nextPage for Cloud; for DC you may need offset/limit
-                base_url = next_page
-                params = {}                     # nextPage already contains query items
+            # Page 0 tells us the total, after which the remaining pages
+            # are independent offset requests that can be fetched in
+            # parallel (bounded by a semaphore to stay under rate limits).
+            first = await self._request_with_backoff(base_url, params=params)
+            if first:
+                # Building thousands of LogEvent objects is pure CPU work;
+                # run it in a worker thread so the loop can keep serving
+                # the backoff timers and the next request.
+                logs.extend(await asyncio.to_thread(self._parse_logs, first))
+
+                total = first.get('total') or 0
+                page_size = len(first.get('records', [])) or JIRA_MAX_RESULTS
+
+                if total > page_size:
+                    sem = asyncio.Semaphore(self.parallelism)
+
+                    async def fetch_page(offset: int) -> Dict:
+                        async with sem:
+                            return await self._request_with_backoff(
+                                base_url, params={**params, "startAt": offset}
+                            )
+
+                    offsets = range(page_size, total, page_size)
+                    pages = await asyncio.gather(*(fetch_page(o) for o in offsets))
+                    for data in pages:
+                        if data:
+                            logs.extend(await asyncio.to_thread(self._parse_logs, data))
+                else:
+                    # No usable total (e.g. Jira DC) -- fall back to serial
+                    # cursor pagination via nextPage.
+                    next_page = first.get("nextPage")
+                    while next_page:
+                        data = await self._request_with_backoff(next_page)
+                        if not data:               # error already logged
+                            break
+                        logs.extend(await asyncio.to_thread(self._parse_logs, data))
+                        next_page = data.get("nextPage")
 
             # Update last fetch time if we successfully got logs
             if logs:
@@ -105,27 +105,40 @@ async def main():
         
         # Connect to TCP server
         tcp_sender.connect()
-        
+
+        async def pump(source):
+            """Fetch from one source, format, and hand off to the sender.
+
+            Failures are contained per source: one bad fetch must not
+            cancel the sibling pumps mid-flight or leave orphaned tasks
+            racing the next polling cycle on the same source instance.
+            """
+            try:
+                logs = await source.fetch_logs()
+                logger.info(f"Fetched {len(logs)} logs from {source.__class__.__name__}")
+
+                if not logs:
+                    return
+
+                # Format logs according to configured format
+                formatted_logs = []
+                for log in logs:
+                    formatted_log = formatter.format(log)
+                    if formatted_log:
+                        formatted_logs.append(formatted_log)
+
+                if formatted_logs:
+                    # Send formatted logs
+                    await tcp_sender.send_logs_async(formatted_logs)
+                    logger.info(f"Forwarded {len(formatted_logs)} logs in {config['formatter']['type'].upper()} format")
+            except Exception as e:
+                logger.error(f"Error in {source.__class__.__name__} pump: {str(e)}")
+
         while True:
             try:
-                # Fetch logs from all sources
-                for source in sources:
-                    logs = await source.fetch_logs()
-                    logger.info(f"Fetched {len(logs)} logs from {source.__class__.__name__}")
-                    
-                    if logs:
-                        # Format logs according to configured format
-                        formatted_logs = []
-                        for log in logs:
-                            formatted_log = formatter.format(log)
-                            if formatted_log:
-                                formatted_logs.append(formatted_log)
-                        
-                        if formatted_logs:
-                            # Send formatted logs
-                            tcp_sender.send_logs(formatted_logs)
-                            logger.info(f"Forwarded {len(formatted_logs)} logs in {config['formatter']['type'].upper()} format")
-                
+                # Fetch/format/send all sources concurrently
+                await asyncio.gather(*(pump(source) for source in sources))
+
                 # Wait for next polling interval
                 await asyncio.sleep(config['sources']['file']['poll_interval'])
                 
@@ -141,4 +154,9 @@ async def main():
             tcp_sender.disconnect()
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:      # uvloop optional
+        pass
     asyncio.run(main()) 
\ No newline at end of file
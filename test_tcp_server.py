@@ -1,82 +1,320 @@
+import multiprocessing
+import os
+import queue
+from collections import deque
+import selectors
 import socket
 import threading
 import logging
+from codecs import utf_8_decode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
+
+# Decouple the network threads from stderr: log calls only enqueue the
+# record; a background listener owns the real handlers and the stream I/O.
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+
 logger = logging.getLogger(__name__)
 
+# Divider for received-log output, built once instead of per message.
+_DIV = "-" * 50
+
+# Pool of reusable receive buffers shared across connections, so
+# short-lived clients do not each allocate (and discard) a fresh 64 KiB
+# buffer. deque append/pop are atomic, so no lock is needed.
+_RECV_BUF_SIZE = 65536
+_recv_buf_pool: deque = deque(maxlen=32)
+
+def _acquire_recv_buf() -> bytearray:
+    try:
+        return _recv_buf_pool.pop()
+    except IndexError:
+        return bytearray(_RECV_BUF_SIZE)
+
+def _release_recv_buf(buf: bytearray) -> None:
+    _recv_buf_pool.append(buf)
+
 class TestTCPServer:
     def __init__(self, host='localhost', port=8080):
         self.host = host
         self.port = port
         self.server_socket = None
-        self.running = False
+        # Single atomic stop flag; loops capture it once and poll
+        # is_set() instead of re-reading an instance attribute.
+        self._stop_event = threading.Event()
+        self._pool = self._new_pool()
+        # stop() pokes this fd so the accept loop's select() returns
+        # immediately instead of sleeping out a poll timeout.
+        self._wake_recv, self._wake_send = self._new_wake_pair()
     
-    def start(self):
-        """Start the TCP server."""
+    def start(self, workers=1):
+        """Start the TCP server.
+
+        With workers > 1, fan out one process per worker, each binding
+        its own SO_REUSEPORT listen socket so the kernel spreads accept
+        load across them (thread-per-core style scaling that sidesteps
+        the GIL on the decode/log path).
+        """
+        if workers > 1:
+            procs = [
+                multiprocessing.Process(target=self._worker_main, daemon=True)
+                for _ in range(workers)
+            ]
+            for proc in procs:
+                proc.start()
+            try:
+                for proc in procs:
+                    proc.join()
+            finally:
+                for proc in procs:
+                    proc.terminate()
+            return
+
+        self._serve()
+
+    @staticmethod
+    def _new_wake_pair():
+        """eventfd is a single 8-byte counter fd (Linux); elsewhere a
+        socketpair stands in."""
+        if hasattr(os, 'eventfd'):
+            fd = os.eventfd(0, os.EFD_NONBLOCK)
+            return fd, fd
+        recv_side, send_side = socket.socketpair()
+        recv_side.setblocking(False)
+        return recv_side, send_side
+
+    def _worker_main(self):
+        """Entry point for a forked worker process.
+
+        Threads do not survive fork: without this, records a worker logs
+        pile up behind the inherited QueueHandler with no listener ever
+        draining them. Restart the log listener on this child's copy of
+        the queue, and give the child its own handler pool and wake fd
+        instead of the parent's.
+        """
+        global _log_listener
+        _log_listener = QueueListener(
+            _log_queue, *_log_listener.handlers, respect_handler_level=True
+        )
+        _log_listener.start()
+        self._pool = self._new_pool()
+        self._wake_recv, self._wake_send = self._new_wake_pair()
+        self._serve()
+
+    @staticmethod
+    def _new_pool():
+        """Bounded handler pool: accepting a connection submits to warm
+        threads instead of paying pthread_create per client, and a
+        connection storm cannot spawn unbounded threads."""
+        return ThreadPoolExecutor(
+            max_workers=(os.cpu_count() or 1) * 4,
+            thread_name_prefix='tcp-handler'
+        )
+
+    def _serve(self):
+        # stop() tears the pool down, so a restarted server needs a
+        # fresh one.
+        if self._pool is None:
+            self._pool = self._new_pool()
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         
+        # Only wake accept() once the client has actually sent data --
+        # log shippers always talk first, so this skips an empty wakeup
+        # per connection (Linux only).
+        if hasattr(socket, 'TCP_DEFER_ACCEPT'):
+            self.server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_DEFER_ACCEPT, 1)
+
         try:
             self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
-            self.running = True
-            
+            # A 5-deep backlog drops connections under a shipper burst;
+            # let the kernel clamp to its configured somaxconn instead.
+            self.server_socket.listen(socket.SOMAXCONN)
+            # Non-blocking listener driven by a selector: the loop sleeps
+            # in select() and only calls accept() when a connection is
+            # actually pending, so accept never blocks the loop.
+            self.server_socket.setblocking(False)
+            self._stop_event.clear()
+            stopping = self._stop_event.is_set
+
             logger.info(f"TCP Server started on {self.host}:{self.port}")
-            
-            while self.running:
-                try:
-                    client_socket, address = self.server_socket.accept()
-                    logger.info(f"New connection from {address}")
-                    
-                    # Handle client in a separate thread
-                    client_thread = threading.Thread(
-                        target=self.handle_client,
-                        args=(client_socket, address)
-                    )
-                    client_thread.start()
-                    
-                except Exception as e:
-                    logger.error(f"Error accepting connection: {str(e)}")
-                    break
-                    
+
+            with selectors.DefaultSelector() as selector:
+                selector.register(self.server_socket, selectors.EVENT_READ)
+                # The wake fd makes stop() interrupt select() directly,
+                # so no poll timeout is needed on the accept loop.
+                selector.register(self._wake_recv, selectors.EVENT_READ)
+
+                while not stopping():
+                    events = selector.select(timeout=None)
+                    for key, _ in events:
+                        if key.fileobj == self._wake_recv:
+                            self._drain_wake()
+                    if not events:
+                        continue
+
+                    # Drain every already-queued connection before going
+                    # back to sleep, so a burst of clients costs a single
+                    # select wakeup instead of one per accept.
+                    while not stopping():
+                        try:
+                            client_socket, address = self.server_socket.accept()
+                        except BlockingIOError:
+                            break
+                        except Exception as e:
+                            logger.error(f"Error accepting connection: {str(e)}")
+                            self._stop_event.set()
+                            break
+
+                        # Small log frames should not sit in Nagle, a big
+                        # receive buffer lets one recv drain a burst, and
+                        # keepalive reaps dead long-lived shippers.
+                        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+                        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+                        logger.info(f"New connection from {address}")
+
+                        # Handle client on the pool
+                        self._pool.submit(self.handle_client, client_socket, address)
+
         except Exception as e:
             logger.error(f"Server error: {str(e)}")
         finally:
             self.stop()
-    
+
+    def _drain_wake(self):
+        """Consume the stop token, otherwise the wake fd stays readable
+        and a later start() on this instance busy-spins in select()."""
+        try:
+            if isinstance(self._wake_recv, int):
+                os.eventfd_read(self._wake_recv)
+            else:
+                self._wake_recv.recv(64)
+        except (BlockingIOError, OSError):
+            pass
+
     def handle_client(self, client_socket, address):
         """Handle client connection and receive logs."""
+        # Render the peer address once; every log line for this
+        # connection reuses the string instead of re-formatting the
+        # tuple per frame.
+        addr_repr = "%s:%s" % address
+        # One receive buffer per connection, taken from the shared pool
+        # and reused for every recv, so the kernel copies into the same
+        # memory instead of a fresh bytes object per chunk. 64 KiB lets
+        # one recv drain a whole burst, and the memoryview slices
+        # without copying.
+        recv_buf = _acquire_recv_buf()
+        recv_view = memoryview(recv_buf)
         try:
-            while self.running:
-                data = client_socket.recv(4096)
-                if not data:
-                    break
-                
-                # Decode and print the received log
-                log_data = data.decode('utf-8').strip()
-                logger.info(f"Received log from {address}:")
-                logger.info("-" * 50)
-                logger.info(log_data)
-                logger.info("-" * 50)
-                
+            # Non-blocking socket: after each readiness wakeup, drain
+            # recvs until EAGAIN (bounded for fairness) and process the
+            # whole burst once, instead of one loop pass per packet.
+            client_socket.setblocking(False)
+            stopping = self._stop_event.is_set
+            with selectors.DefaultSelector() as selector:
+                selector.register(client_socket, selectors.EVENT_READ)
+
+                # Frames are newline-delimited, so buffer across recvs and
+                # only hand out complete lines; a line split over two
+                # packets is no longer logged in halves.
+                pending = bytearray()
+                eof = False
+
+                # Bind everything the loop touches to locals: each pass
+                # then costs only LOAD_FAST, with no attribute or method
+                # lookups left on the per-recv path.
+                select = selector.select
+                recv_into = client_socket.recv_into
+                find_newline = pending.rfind
+                log_frame = self._log_frame
+
+                while not stopping() and not eof:
+                    if not select(timeout=1.0):
+                        continue
+
+                    for _ in range(64):
+                        try:
+                            nbytes = recv_into(recv_buf)
+                        except BlockingIOError:
+                            break
+                        if not nbytes:
+                            eof = True
+                            break
+                        pending += recv_view[:nbytes]
+
+                    newline = find_newline(b'\n')
+                    if newline < 0:
+                        if eof and pending:
+                            log_frame(addr_repr, pending)
+                        continue
+
+                    frame = pending[:newline]
+                    del pending[:newline + 1]
+                    log_frame(addr_repr, frame)
+                    if eof and pending:
+                        log_frame(addr_repr, pending)
+
         except Exception as e:
-            logger.error(f"Error handling client {address}: {str(e)}")
+            logger.error("Error handling client %s: %s", addr_repr, e)
         finally:
+            recv_view.release()
+            _release_recv_buf(recv_buf)
             client_socket.close()
-            logger.info(f"Connection closed for {address}")
+            logger.info("Connection closed for %s", addr_repr)
+
+    @staticmethod
+    def _log_frame(addr_repr, frame):
+        """Decode and print one complete (possibly multi-line) frame.
+
+        One lazy %-style call: a single logging-lock acquisition per
+        frame, and no string work at all when INFO is disabled.
+        """
+        if logger.isEnabledFor(logging.INFO):
+            # Direct C codec call, skipping the str-method wrapper and
+            # codec registry lookup; frames are already newline-stripped
+            # by the framing loop, so only a stray \r needs trimming --
+            # cheaper than a full strip() scan+copy.
+            log_data, _ = utf_8_decode(frame, 'strict', True)
+            if log_data.endswith('\r'):
+                log_data = log_data[:-1]
+            logger.info("Received log from %s:\n%s\n%s\n%s",
+                        addr_repr, _DIV, log_data, _DIV)
     
     def stop(self):
         """Stop the TCP server."""
-        self.running = False
+        self._stop_event.set()
+        try:
+            if isinstance(self._wake_send, int):
+                os.eventfd_write(self._wake_send, 1)
+            else:
+                self._wake_send.send(b'\0')
+        except OSError:    # already closed on a repeated stop()
+            pass
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
         if self.server_socket:
             self.server_socket.close()
         logger.info("TCP Server stopped")
+        if _log_listener._thread is not None:    # idempotent: stop() may run twice
+            _log_listener.stop()
 
 if __name__ == "__main__":
     server = TestTCPServer()